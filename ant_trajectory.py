@@ -50,15 +50,28 @@ These assumptions intentionally simplify real biology
 to highlight the core navigation principle.
 """
 
+from math import cos, sin
+
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.lines import Line2D
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional: without it the heading recurrence runs as
+    # plain Python, which is fast enough for the default step count.
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
 
 # =====================================================
 # SIMULATION PARAMETERS
 # =====================================================
 
-np.random.seed(1)          # Ensures reproducibility
+rng = np.random.default_rng(1)  # Seeded generator for reproducibility
 
 step_length = 0.5          # Distance traveled per step
 num_explore_steps = 120    # Number of steps during exploration
@@ -69,82 +82,104 @@ scan_gain = 0.1            # Strength of heading correction during scan
 sun_direction = 0.0        # Global compass reference (radians)
                            # Defines the x-axis direction
 
+float_dtype = np.float32   # Precision of trajectory arrays
+                           # (plenty for visualization)
+
 # =====================================================
-# STATE VARIABLES
+# HEADING MODEL
 # =====================================================
 
-# True physical position of the ant
-x, y = 0.0, 0.0
-
-# Integrated displacement vector (ant's internal memory)
-Dx, Dy = 0.0, 0.0
-
-# Current heading of the ant (relative to Sun)
-theta = 0.0
+@njit(cache=True)
+def integrate_heading(deltas, scan_interval, scan_gain, sun_direction,
+                      out_heading, out_theta):
+    """
+    Accumulate random heading changes into the ant's heading.
 
-# History storage (used only for visualization)
-explore_x = [x]
-explore_y = [y]
-Dx_hist = [Dx]
-Dy_hist = [Dy]
-theta_hist = [theta]
+    Periodic scanning makes each heading depend on the previous one,
+    so this recurrence is the only part of the exploration that has to
+    run step by step. It is compiled with Numba when available.
 
-# =====================================================
-# EXPLORATION PHASE (SEARCHING FOR FOOD)
-# =====================================================
-
-for step in range(num_explore_steps):
+    Writes the heading used for each step into out_heading and the
+    heading history after scanning corrections into out_theta
+    (starting from theta = 0).
+    """
+    # Current heading of the ant (relative to Sun)
+    theta = 0.0
+    out_theta[0] = theta
 
-    # Random change in heading: exploratory behavior
-    theta += np.random.uniform(-np.pi / 4, np.pi / 4)
+    for step in range(deltas.shape[0]):
 
-    # Physical movement in the current direction
-    dx = step_length * np.cos(theta)
-    dy = step_length * np.sin(theta)
+        # Random change in heading: exploratory behavior
+        theta += deltas[step]
+        out_heading[step] = theta
 
-    x += dx
-    y += dy
+        # Periodic scanning:
+        # Ant rechecks Sun direction to reduce compass drift
+        if step % scan_interval == 0:
+            theta -= scan_gain * (theta - sun_direction)
 
-    # Path integration:
-    # The ant updates its internal estimate of displacement
-    Dx += dx
-    Dy += dy
+        out_theta[step + 1] = theta
 
-    # Periodic scanning:
-    # Ant rechecks Sun direction to reduce compass drift
-    if step % scan_interval == 0:
-        theta -= scan_gain * (theta - sun_direction)
+# =====================================================
+# EXPLORATION PHASE (SEARCHING FOR FOOD)
+# =====================================================
 
-    # Store history for later visualization
-    explore_x.append(x)
-    explore_y.append(y)
-    Dx_hist.append(Dx)
-    Dy_hist.append(Dy)
-    theta_hist.append(theta)
+# History storage (used only for visualization), preallocated and
+# filled in place; index 0 is the state at the nest
+explore_x = np.empty(num_explore_steps + 1, dtype=float_dtype)
+explore_y = np.empty(num_explore_steps + 1, dtype=float_dtype)
+Dx_hist = np.empty(num_explore_steps + 1, dtype=float_dtype)
+Dy_hist = np.empty(num_explore_steps + 1, dtype=float_dtype)
+theta_hist = np.empty(num_explore_steps + 1, dtype=float_dtype)
+heading = np.empty(num_explore_steps, dtype=float_dtype)
+
+# All random heading changes are drawn up front in a single call
+deltas = rng.uniform(-np.pi / 4, np.pi / 4, num_explore_steps)
+deltas = deltas.astype(float_dtype)
+integrate_heading(deltas, scan_interval, scan_gain, sun_direction,
+                  heading, theta_hist)
+
+# Physical movement in the heading of each step; the complex
+# exponential yields cos and sin together in a single pass
+steps = step_length * np.exp(1j * heading)
+dx = steps.real
+dy = steps.imag
+
+# True physical position of the ant (starts at the nest)
+explore_x[0], explore_y[0] = 0.0, 0.0
+np.cumsum(dx, out=explore_x[1:])
+np.cumsum(dy, out=explore_y[1:])
+
+# Path integration:
+# The ant's internal estimate of displacement (ant's memory)
+Dx_hist[0], Dy_hist[0] = 0.0, 0.0
+np.cumsum(dx, out=Dx_hist[1:])
+np.cumsum(dy, out=Dy_hist[1:])
+Dx, Dy = Dx_hist[-1], Dy_hist[-1]
 
 # Food location (end of exploration)
-food_x, food_y = x, y
+food_x, food_y = explore_x[-1], explore_y[-1]
 
 # =====================================================
 # RETURNING TO NEST
 # =====================================================
 
 # Resultant displacement vector (from nest to food)
-R_mag = np.sqrt(Dx**2 + Dy**2)      # Distance to nest
+R_mag = np.hypot(Dx, Dy)            # Distance to nest
 R_angle = np.arctan2(Dy, Dx)        # Direction of resultant vector
 
 # To return home, the ant walks in the opposite direction
 home_angle = R_angle + np.pi
 num_home_steps = int(R_mag / step_length)
 
-home_x = [food_x]
-home_y = [food_y]
+# Every homing step is the same displacement, computed once
+home_dx = step_length * cos(home_angle)
+home_dy = step_length * sin(home_angle)
 
-for _ in range(num_home_steps):
-    food_x += step_length * np.cos(home_angle)
-    food_y += step_length * np.sin(home_angle)
-    home_x.append(food_x)
-    home_y.append(food_y)
+# so the path is affine in the step index and needs no loop
+t = np.arange(num_home_steps + 1, dtype=float_dtype)
+home_x = food_x + t * home_dx
+home_y = food_y + t * home_dy
 
 # =====================================================
 # STATIC SUMMARY PLOT
@@ -174,7 +209,7 @@ plt.title("Ant-Inspired Path Integration – Summary View")
 plt.axis("equal")
 plt.grid(True)
 plt.legend()
-plt.savefig("ant_navigation_plot.png", dpi=300)
+plt.savefig("ant_navigation_plot.png", dpi=150, bbox_inches="tight")
 plt.show()
 
 # =====================================================
@@ -182,13 +217,13 @@ plt.show()
 # =====================================================
 
 # Determine plot limits dynamically
-all_x = explore_x + home_x
-all_y = explore_y + home_y
+all_x = np.concatenate([explore_x, home_x])
+all_y = np.concatenate([explore_y, home_y])
 margin = 2
 
 fig, ax = plt.subplots(figsize=(6, 6))
-ax.set_xlim(min(all_x) - margin, max(all_x) + margin)
-ax.set_ylim(min(all_y) - margin, max(all_y) + margin)
+ax.set_xlim(all_x.min() - margin, all_x.max() + margin)
+ax.set_ylim(all_y.min() - margin, all_y.max() + margin)
 ax.set_aspect("equal")
 ax.grid(True)
 
@@ -197,13 +232,13 @@ line_explore, = ax.plot([], [], "b-", label="Exploration Path")
 line_home, = ax.plot([], [], "r-", linewidth=2, label="Returning Path")
 ant_dot, = ax.plot([], [], "ko", markersize=6)
 
-# Dummy line to show resultant vector in legend
-vector_legend, = ax.plot([], [], color="green", linewidth=2,
-                         label="Resultant Vector")
-
 # Actual arrow representing the resultant vector
-vector_arrow = ax.arrow(0, 0, 0, 0, color="green",
-                        width=0.05, length_includes_head=True)
+# (created once and updated in place on every frame)
+vector_arrow = ax.quiver(
+    [0], [0], [Dx_hist[0]], [Dy_hist[0]],
+    angles="xy", scale_units="xy", scale=1,
+    color="green"
+)
 
 # Text box showing live computed values
 info_text = ax.text(
@@ -214,9 +249,56 @@ info_text = ax.text(
     bbox=dict(boxstyle="round", facecolor="white", alpha=0.85)
 )
 
-ax.scatter(0, 0, c="green", s=80, label="Nest")
-ax.scatter(explore_x[-1], explore_y[-1], c="orange", s=80, label="Food")
-ax.legend(loc="lower left")
+nest_marker = ax.scatter(0, 0, c="green", s=80, label="Nest")
+food_marker = ax.scatter(explore_x[-1], explore_y[-1], c="orange", s=80,
+                         label="Food")
+
+# Proxy handle for the resultant vector in the legend
+# (never added to the axes, so it is not drawn on every frame)
+vector_legend = Line2D([0], [0], color="green", linewidth=2,
+                       label="Resultant Vector")
+ax.legend(
+    handles=[line_explore, line_home, vector_legend,
+             nest_marker, food_marker],
+    loc="lower left"
+)
+
+# Per-frame values are precomputed once so update() only indexes them
+num_explore_frames = len(explore_x)
+num_home_frames = len(home_x)
+theta_deg_hist = np.degrees(theta_hist)
+R_mags = np.hypot(Dx_hist, Dy_hist)
+R_angle_deg = np.degrees(R_angle)
+
+# Fixed-length path buffers: points not yet reached stay NaN, which
+# matplotlib leaves undrawn, so each frame only reveals the new points
+explore_buf_x = np.full(num_explore_frames, np.nan)
+explore_buf_y = np.full(num_explore_frames, np.nan)
+home_buf_x = np.full(num_home_frames, np.nan)
+home_buf_y = np.full(num_home_frames, np.nan)
+
+# Only every frame_stride-th step is rendered; the last step is always
+# included so the animation ends with the ant back at the nest
+frame_stride = 2
+num_frames = num_explore_frames + num_home_frames
+frames = list(range(0, num_frames, frame_stride))
+if frames[-1] != num_frames - 1:
+    frames.append(num_frames - 1)
+
+def init():
+    """
+    Reset the animated artists to an empty state.
+    Everything else on the axes is static and drawn only once.
+    """
+    for buf in (explore_buf_x, explore_buf_y, home_buf_x, home_buf_y):
+        buf.fill(np.nan)
+    line_explore.set_data(explore_buf_x, explore_buf_y)
+    line_home.set_data(home_buf_x, home_buf_y)
+    ant_dot.set_data([], [])
+    vector_arrow.set_UVC([0], [0])
+    info_text.set_text("")
+
+    return line_explore, line_home, ant_dot, vector_arrow, info_text
 
 def update(frame):
     """
@@ -224,51 +306,50 @@ def update(frame):
     Shows how the displacement vector is accumulated during exploration
     and then directly used for Returning.
     """
-    global vector_arrow
-    vector_arrow.remove()
-
-    if frame < len(explore_x):
+    if frame < num_explore_frames:
         # Exploration phase
-        line_explore.set_data(explore_x[:frame], explore_y[:frame])
+        lo = max(frame - frame_stride + 1, 0)
+        explore_buf_x[lo:frame + 1] = explore_x[lo:frame + 1]
+        explore_buf_y[lo:frame + 1] = explore_y[lo:frame + 1]
+        line_explore.set_data(explore_buf_x, explore_buf_y)
         ant_dot.set_data([explore_x[frame]], [explore_y[frame]])
 
         Rx, Ry = Dx_hist[frame], Dy_hist[frame]
-        Rm = np.sqrt(Rx**2 + Ry**2)
-        th = theta_hist[frame]
-
-        vector_arrow = ax.arrow(
-            0, 0, Rx, Ry,
-            color="green",
-            width=0.05,
-            length_includes_head=True
-        )
+        Rm = R_mags[frame]
+        th_deg = theta_deg_hist[frame]
+
+        vector_arrow.set_UVC([Rx], [Ry])
 
         info_text.set_text(
             "Exploration Phase\n"
             f"x = {explore_x[frame]:.2f}, y = {explore_y[frame]:.2f}\n"
             f"Dx = {Rx:.2f}, Dy = {Ry:.2f}\n"
             f"|R| = {Rm:.2f}\n"
-            f"θ = {np.degrees(th):.1f}°"
+            f"θ = {th_deg:.1f}°"
         )
 
     else:
         # Returing phase
-        f = frame - len(explore_x)
-        if f < len(home_x):
-            line_home.set_data(home_x[:f], home_y[:f])
+        f = frame - num_explore_frames
+        if f < num_home_frames:
+            if f < frame_stride:
+                # Reveal exploration steps skipped before the switch
+                explore_buf_x[:] = explore_x
+                explore_buf_y[:] = explore_y
+                line_explore.set_data(explore_buf_x, explore_buf_y)
+
+            lo = max(f - frame_stride + 1, 0)
+            home_buf_x[lo:f + 1] = home_x[lo:f + 1]
+            home_buf_y[lo:f + 1] = home_y[lo:f + 1]
+            line_home.set_data(home_buf_x, home_buf_y)
             ant_dot.set_data([home_x[f]], [home_y[f]])
 
-            vector_arrow = ax.arrow(
-                0, 0, Dx, Dy,
-                color="green",
-                width=0.05,
-                length_includes_head=True
-            )
+            vector_arrow.set_UVC([Dx], [Dy])
 
             info_text.set_text(
                 "Returning Phase\n"
                 f"|R| = {R_mag:.2f}\n"
-                f"θ_R = {np.degrees(R_angle):.1f}°\n"
+                f"θ_R = {R_angle_deg:.1f}°\n"
                 "Walking along −R"
             )
 
@@ -277,9 +358,10 @@ def update(frame):
 ani = animation.FuncAnimation(
     fig,
     update,
-    frames=len(explore_x) + len(home_x),
-    interval=100,
-    blit=False
+    frames=frames,
+    init_func=init,
+    interval=100 * frame_stride,
+    blit=True
 )
 
 ani.save("ant_navigation.gif", writer="pillow")